@@ -1,10 +1,19 @@
 from hashlib import sha256
+from logging import getLogger
+from os import makedirs, remove, scandir
 from os.path import exists, join
+from time import time
 
 from .persistence import PersistenceStore
 from .util import atomicish_move
 from .util import Time
 
+log = getLogger(__name__)
+
+# Scratch files older than this are left over from uploads interrupted by a
+# crashed or killed server and are removed when the cache is opened.
+STALE_SCRATCH_SECONDS = 24 * 60 * 60
+
 
 class CacheFileMapper:
 
@@ -23,6 +32,11 @@ class Cache(PersistenceStore):
     def __init__(self, cache_directory="file_cache"):
         super().__init__(join(cache_directory, "cache_shelf"))
         self.file_mapper = CacheFileMapper(cache_directory)
+        # Incoming files are staged here (tokens are hex digests so can't
+        # collide with it) and then renamed into the cache.
+        self.scratch_path = join(cache_directory, "tmp")
+        makedirs(self.scratch_path, exist_ok=True)
+        self.__purge_stale_scratch_files()
         self.time = Time
 
     def cache_required(self, ip, path):
@@ -44,6 +58,25 @@ class Cache(PersistenceStore):
         destination = self.__destination(ip, path)
         atomicish_move(local_path, destination)
 
+    def scratch_directory(self):
+        """
+        Directory to stage incoming files in before cache_file, on the
+        same filesystem as the cache so moving them in is a rename.
+        """
+        return self.scratch_path
+
+    def __purge_stale_scratch_files(self):
+        # Not cleared outright - another server process sharing the cache
+        # may be staging an upload here right now.
+        cutoff = time() - STALE_SCRATCH_SECONDS
+        with scandir(self.scratch_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                        remove(entry.path)
+                except OSError:
+                    log.warning("Failed to remove stale cache scratch file [%s]", entry.path)
+
     def file_available(self, ip, path):
         token = self.__token(ip, path)
         ready = exists(self.destination(token))
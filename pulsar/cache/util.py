@@ -2,6 +2,7 @@ import os
 import shutil
 
 from datetime import datetime
+from errno import EXDEV
 
 
 def atomicish_move(source, destination, tmp_suffix="_TMP"):
@@ -19,6 +20,13 @@ def atomicish_move(source, destination, tmp_suffix="_TMP"):
     > assert not exists(source)
     > assert exists(destination)
     """
+    try:
+        # Same filesystem - a single atomic rename.
+        os.replace(source, destination)
+        return
+    except OSError as exc:
+        if exc.errno != EXDEV:
+            raise
     destination_dir = os.path.dirname(destination)
     destination_name = os.path.basename(destination)
     temp_destination = os.path.join(destination_dir, "{}{}".format(destination_name, tmp_suffix))
@@ -29,7 +37,5 @@ def atomicish_move(source, destination, tmp_suffix="_TMP"):
 class Time:
     """Time utilities of now that can be instrumented for testing."""
 
-    @classmethod
-    def now(cls):
-        """Return the current datetime."""
-        return datetime.utcnow()
+    # Return the current datetime.
+    now = staticmethod(datetime.utcnow)
@@ -1,12 +1,11 @@
 """
 """
 import os.path
-import posixpath
-from collections import deque
 from glob import glob
 from logging import getLogger
 
 from galaxy.util import in_directory
+from galaxy.util.path import safe_contains
 
 from .util import PathHelper
 
@@ -27,6 +26,21 @@ TYPES_TO_METHOD = dict(
     output_jobdir="job_directory",
 )
 
+# Subdirectories a Pulsar server creates when setting up a job directory.
+SETUP_SUB_DIRECTORY_NAMES = (
+    "inputs",
+    "working",
+    "outputs",
+    "configs",
+    "tool_files",
+    "metadata",
+)
+SUB_DIRECTORY_NAMES = SETUP_SUB_DIRECTORY_NAMES + (
+    "home",
+    "unstructured",
+    "tmp",
+)
+
 
 class RemoteJobDirectory:
     """ Representation of a (potentially) remote Pulsar-style staging directory.
@@ -41,33 +55,37 @@ class RemoteJobDirectory:
             )
         else:
             self.job_directory = remote_staging_directory
+        self._sub_dirs = {
+            name: self.path_helper.remote_join(self.job_directory, name)
+            for name in SUB_DIRECTORY_NAMES
+        }
 
     def home_directory(self):
-        return self._sub_dir('home')
+        return self._sub_dirs["home"]
 
     def metadata_directory(self):
-        return self._sub_dir('metadata')
+        return self._sub_dirs["metadata"]
 
     def working_directory(self):
-        return self._sub_dir('working')
+        return self._sub_dirs["working"]
 
     def inputs_directory(self):
-        return self._sub_dir('inputs')
+        return self._sub_dirs["inputs"]
 
     def outputs_directory(self):
-        return self._sub_dir('outputs')
+        return self._sub_dirs["outputs"]
 
     def configs_directory(self):
-        return self._sub_dir('configs')
+        return self._sub_dirs["configs"]
 
     def tool_files_directory(self):
-        return self._sub_dir('tool_files')
+        return self._sub_dirs["tool_files"]
 
     def unstructured_files_directory(self):
-        return self._sub_dir('unstructured')
+        return self._sub_dirs["unstructured"]
 
     def default_tmp_directory(self):
-        return self._sub_dir('tmp')
+        return self._sub_dirs["tmp"]
 
     @property
     def path(self):
@@ -103,8 +121,11 @@ class RemoteJobDirectory:
         return self.path_helper.remote_join(self.job_directory, name)
 
 
-def get_mapped_file(directory, remote_path, allow_nested_files=False, local_path_module=os.path, mkdir=True, allow_globs=False):
-    """
+def get_mapped_file(directory, remote_path, allow_nested_files=False, local_path_module=os.path, mkdir=True, allow_globs=False,
+                    normalized_directory=None):
+    """ Map remote_path to a path in directory. Callers mapping many files into
+    the same directory can pass normalized_directory (the realpath of directory
+    for local paths) to avoid resolving directory again for each file.
 
     >>> import ntpath
     >>> get_mapped_file(r'C:\\pulsar\\staging\\101', 'dataset_1_files/moo/cow', allow_nested_files=True, local_path_module=ntpath, mkdir=False)
@@ -121,7 +142,10 @@ def get_mapped_file(directory, remote_path, allow_nested_files=False, local_path
     else:
         local_rel_path = __posix_to_local_path(remote_path, local_path_module=local_path_module)
         local_path = local_path_module.join(directory, local_rel_path)
-        verify_is_in_directory(local_path, directory, local_path_module=local_path_module)
+        if normalized_directory is None:
+            verify_is_in_directory(local_path, directory, local_path_module=local_path_module)
+        else:
+            _verify_is_in_normalized_directory(local_path, normalized_directory, local_path_module=local_path_module)
         local_directory = local_path_module.dirname(local_path)
         if mkdir and not local_path_module.exists(local_directory):
             os.makedirs(local_directory)
@@ -148,18 +172,40 @@ def __posix_to_local_path(path, local_path_module=os.path):
     >>> import posixpath
     >>> __posix_to_local_path('dataset_1_files/moo/cow', local_path_module=posixpath)
     'dataset_1_files/moo/cow'
+    >>> __posix_to_local_path('//dataset_1_files//moo/', local_path_module=posixpath)
+    'dataset_1_files/moo/'
+    >>> __posix_to_local_path('/', local_path_module=posixpath)
+    Traceback (most recent call last):
+    ...
+    Exception: Invalid empty path specified [/]
     """
-    partial_path = deque()
-    while True:
-        if not path or path == '/':
-            break
-        (path, base) = posixpath.split(path)
-        partial_path.appendleft(base)
-    return local_path_module.join(*partial_path)
+    parts = [part for part in path.split('/') if part]
+    if not parts:
+        raise Exception("Invalid empty path specified [%s]" % path)
+    if path.endswith('/'):
+        # Keep the trailing separator, as the path split loop used to.
+        parts.append('')
+    return local_path_module.join(*parts)
 
 
 def verify_is_in_directory(path, directory, local_path_module=os.path):
-    if not in_directory(path, directory, local_path_module):
+    _verify_is_in_normalized_directory(path, normalize_directory(directory, local_path_module), local_path_module)
+
+
+def normalize_directory(directory, local_path_module=os.path):
+    """ Resolve directory the way in_directory does before checking containment.
+    """
+    if local_path_module is os.path:
+        directory = os.path.realpath(directory)
+    return directory
+
+
+def _verify_is_in_normalized_directory(path, directory, local_path_module=os.path):
+    if local_path_module is os.path:
+        contained = safe_contains(directory, path)
+    else:
+        contained = in_directory(path, directory, local_path_module)
+    if not contained:
         msg = "Attempt to read or write file outside an authorized directory."
         log.warn("{} Attempted path: {}, valid directory: {}".format(msg, path, directory))
         raise Exception(msg)
@@ -50,6 +50,24 @@ class ManagerInterface:
         PULSAR_UNKNOWN_RETURN_CODE.
         """
 
+    def get_statuses(self, job_ids):
+        """
+        Return a dict mapping each of the specified job ids to its status.
+
+        The default implementation calls ``get_status`` for each job; managers
+        backed by a batch scheduler interface (e.g. DRMAA session
+        synchronization or a single ``qstat -f`` for PBS) should override this
+        to query all jobs at once.
+        """
+        return {job_id: self.get_status(job_id) for job_id in job_ids}
+
+    def return_codes(self, job_ids):
+        """
+        Return a dict mapping each of the specified job ids to its return code
+        (see ``return_code``).
+        """
+        return {job_id: self.return_code(job_id) for job_id in job_ids}
+
     @abstractmethod
     def stdout_contents(self, job_id):
         """
@@ -111,6 +129,12 @@ class ManagerProxy:
     def return_code(self, *args, **kwargs):
         return self._proxied_manager.return_code(*args, **kwargs)
 
+    def get_statuses(self, *args, **kwargs):
+        return self._proxied_manager.get_statuses(*args, **kwargs)
+
+    def return_codes(self, *args, **kwargs):
+        return self._proxied_manager.return_codes(*args, **kwargs)
+
     def stdout_contents(self, *args, **kwargs):
         return self._proxied_manager.stdout_contents(*args, **kwargs)
 
@@ -7,11 +7,12 @@ import json
 import logging
 import os
 import platform
+import sys
 from os import (
     curdir,
     getenv,
-    listdir,
     makedirs,
+    scandir,
     sep,
     walk,
 )
@@ -28,7 +29,9 @@ from uuid import uuid4
 from pulsar import locks
 from pulsar.client.job_directory import (
     get_mapped_file,
+    normalize_directory,
     RemoteJobDirectory,
+    SETUP_SUB_DIRECTORY_NAMES,
 )
 from pulsar.managers import ManagerInterface
 
@@ -39,6 +42,14 @@ JOB_DIRECTORY_METADATA = "metadata"
 JOB_DIRECTORY_CONFIGS = "configs"
 JOB_DIRECTORY_TOOL_FILES = "tool_files"
 
+# Job files up to this size are read with a single read call.
+SINGLE_READ_LIMIT = 1 << 17
+# Maximum number of buffers passed to a single writev call (IOV_MAX on
+# Linux and macOS).
+WRITEV_MAX_BUFFERS = 1024
+# Job files are raw bytes - keep Windows from opening descriptors in text mode.
+O_BINARY = getattr(os, "O_BINARY", 0)
+
 DEFAULT_ID_ASSIGNER = "galaxy"
 
 ID_ASSIGNER = {
@@ -94,7 +105,7 @@ class BaseManager(ManagerInterface):
             try:
                 job_directory.delete()
             except Exception:
-                pass
+                log.exception("Failed to delete job directory for job [%s]", job_id)
 
     def system_properties(self):
         return self.__system_properties
@@ -163,14 +174,7 @@ class BaseManager(ManagerInterface):
 
     def _setup_job_directory(self, job_id):
         job_directory = self._job_directory(job_id)
-        job_directory.setup()
-        for directory in [JOB_DIRECTORY_INPUTS,
-                          JOB_DIRECTORY_WORKING,
-                          JOB_DIRECTORY_OUTPUTS,
-                          JOB_DIRECTORY_CONFIGS,
-                          JOB_DIRECTORY_TOOL_FILES,
-                          JOB_DIRECTORY_METADATA]:
-            job_directory.make_directory(directory)
+        job_directory.setup_all()
         return job_directory
 
     def _get_authorization(self, job_id, tool_id):
@@ -183,23 +187,23 @@ class BaseManager(ManagerInterface):
         self.user_auth_manager.authorize(job_id, job_directory)
 
         tool_files_dir = job_directory.tool_files_directory()
-        for file in self._list_dir(tool_files_dir):
-            if os.path.isdir(join(tool_files_dir, file)):
+        for entry in self._scan_dir(tool_files_dir):
+            if entry.is_dir():
                 continue
-            contents = open(join(tool_files_dir, file)).read()
-            log.debug("job_id: {} - checking tool file {}".format(job_id, file))
-            authorization.authorize_tool_file(basename(file), contents)
+            contents = open(entry.path).read()
+            log.debug("job_id: {} - checking tool file {}".format(job_id, entry.name))
+            authorization.authorize_tool_file(entry.name, contents)
         config_files_dir = job_directory.configs_directory()
-        for file in self._list_dir(config_files_dir):
-            path = join(config_files_dir, file)
-            authorization.authorize_config_file(job_directory, file, path)
+        for entry in self._scan_dir(config_files_dir):
+            authorization.authorize_config_file(job_directory, entry.name, entry.path)
         authorization.authorize_execution(job_directory, command_line)
 
-    def _list_dir(self, directory_or_none):
+    def _scan_dir(self, directory_or_none):
         if directory_or_none is None or not exists(directory_or_none):
             return []
         else:
-            return listdir(directory_or_none)
+            with scandir(directory_or_none) as entries:
+                return list(entries)
 
     def _expand_command_line(self, job_id, command_line: str, dependencies_description, job_directory=None) -> str:
         if dependencies_description is None:
@@ -239,6 +243,8 @@ class JobDirectory(RemoteJobDirectory):
         super().__init__(staging_directory, remote_id=job_id, remote_sep=sep)
         self._directory_maker = directory_maker or DirectoryMaker()
         self.lock_manager = lock_manager
+        # Resolved (realpath) directories, filled as files are mapped into them.
+        self._normalized_directories = {}
         # Assert this job id isn't hacking path somehow.
         assert job_id == basename(job_id)
 
@@ -250,27 +256,52 @@ class JobDirectory(RemoteJobDirectory):
         and create directory if needed.
         """
         directory, allow_nested_files, allow_globs = self._directory_for_file_type(input_type)
-        path = get_mapped_file(directory, remote_path, allow_nested_files=allow_nested_files, allow_globs=allow_globs)
+        normalized_directory = None
+        if allow_nested_files:
+            normalized_directory = self._normalized_directory(directory)
+        path = get_mapped_file(
+            directory,
+            remote_path,
+            allow_nested_files=allow_nested_files,
+            allow_globs=allow_globs,
+            normalized_directory=normalized_directory,
+        )
         return path
 
+    def _normalized_directory(self, directory):
+        normalized_directory = self._normalized_directories.get(directory)
+        if normalized_directory is None:
+            normalized_directory = self._normalized_directories[directory] = normalize_directory(directory)
+        return normalized_directory
+
     def read_file(self, name, size=-1, default=None):
         path = self._job_file(name)
-        job_file = None
         try:
-            job_file = open(path, 'rb')
-            return job_file.read(size)
+            fd = os.open(path, os.O_RDONLY | O_BINARY)
+            try:
+                return _read_fd(fd, size)
+            finally:
+                os.close(fd)
         except Exception:
             if default is not None:
                 return default
             else:
                 raise
-        finally:
-            if job_file:
-                job_file.close()
 
-    def write_file(self, name, contents):
+    def write_file(self, name, contents, mode=None):
+        """ Write contents to a job file.
+
+        If mode is specified and the file does not exist yet, it is created
+        with those permission bits rather than fixed up with a separate chmod
+        afterward - like open() the process umask applies, so the result is
+        mode & ~umask. If the file already exists it is truncated and its
+        permissions set to exactly mode.
+        """
         path = self._job_file(name)
-        job_file = open(path, 'wb')
+        if mode is None:
+            job_file = open(path, 'wb')
+        else:
+            job_file = _open_with_mode(path, mode)
         try:
             if isinstance(contents, str):
                 contents = contents.encode("UTF-8")
@@ -279,13 +310,26 @@ class JobDirectory(RemoteJobDirectory):
             job_file.close()
         return path
 
+    def write_file_parts(self, name, parts):
+        """ Write an iterable of str or bytes parts to a job file, without
+        first joining them into one buffer.
+        """
+        path = self._job_file(name)
+        buffers = [part.encode("UTF-8") if isinstance(part, str) else part for part in parts]
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o666)
+        try:
+            _write_fd(fd, buffers)
+        finally:
+            os.close(fd)
+        return path
+
     def remove_file(self, name):
         """
-        Quietly remove a job file.
+        Quietly remove a job file if it exists.
         """
         try:
             os.remove(self._job_file(name))
-        except OSError:
+        except FileNotFoundError:
             pass
 
     def contains_file(self, name):
@@ -298,11 +342,22 @@ class JobDirectory(RemoteJobDirectory):
         return os.path.exists(self.path)
 
     def delete(self):
-        return rmtree(self.path)
+        if sys.version_info >= (3, 12):
+            return rmtree(self.path, onexc=_log_delete_error)
+        return rmtree(self.path, onerror=lambda function, path, excinfo: _log_delete_error(function, path, excinfo[1]))
 
     def setup(self):
         self._directory_maker.make(self.job_directory)
 
+    def setup_all(self, names=SETUP_SUB_DIRECTORY_NAMES):
+        """ Create the job directory and the given subdirectories of it in
+        one sweep.
+        """
+        make = self._directory_maker.make
+        make(self.job_directory)
+        for name in names:
+            make(self._sub_dirs[name])
+
     def make_directory(self, name):
         path = self._job_file(name)
         self._directory_maker.make(path)
@@ -373,6 +428,79 @@ class JobDirectory(RemoteJobDirectory):
         self.remove_file(metadata_name)
 
 
+def _open_with_mode(path, mode):
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | O_BINARY, mode)
+    except FileExistsError:
+        fd = os.open(path, os.O_WRONLY | os.O_TRUNC | O_BINARY)
+        try:
+            # os.fchmod is unavailable on Windows before Python 3.13.
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, mode)
+            else:
+                os.chmod(path, mode)
+        except BaseException:
+            os.close(fd)
+            raise
+    return open(fd, 'wb')
+
+
+def _log_delete_error(function, path, exc):
+    log.warning("Failed to remove [%s] while deleting job directory: %s", path, exc)
+
+
+def _read_fd(fd, size=-1):
+    """ Read up to size bytes (or everything if size is negative) from fd.
+
+    Small files are read with a single read of their known size, skipping
+    the buffered file object stack entirely.
+    """
+    chunks = []
+    if size < 0:
+        file_size = os.fstat(fd).st_size
+        if file_size < SINGLE_READ_LIMIT:
+            contents = os.read(fd, file_size + 1)
+            if len(contents) <= file_size:
+                # Short read of a regular file - at end of file.
+                return contents
+            chunks.append(contents)
+        while True:
+            chunk = os.read(fd, SINGLE_READ_LIMIT)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    else:
+        remaining = size
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _write_fd(fd, buffers):
+    """ Write all buffers to fd, with as few writev calls as possible.
+    """
+    writev = getattr(os, "writev", None)
+    buffers = [memoryview(buffer) for buffer in buffers if len(buffer)]
+    index = 0
+    while index < len(buffers):
+        if writev is not None:
+            written = writev(fd, buffers[index:index + WRITEV_MAX_BUFFERS])
+        else:
+            written = os.write(fd, buffers[index])
+        # Skip past fully written buffers and trim a partially written one.
+        while written:
+            size = len(buffers[index])
+            if written < size:
+                buffers[index] = buffers[index][written:]
+                break
+            written -= size
+            index += 1
+
+
 class DirectoryMaker:
 
     def __init__(self, mode=None):
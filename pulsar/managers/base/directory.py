@@ -93,8 +93,8 @@ class DirectoryBaseManager(BaseManager):
     def _read_job_file(self, job_id, name, **kwds):
         return self._job_directory(job_id).read_file(name, **kwds)
 
-    def _write_job_file(self, job_id, name, contents):
-        return self._job_directory(job_id).write_file(name, contents)
+    def _write_job_file(self, job_id, name, contents, mode=None):
+        return self._job_directory(job_id).write_file(name, contents, mode=mode)
 
     def _write_return_code_if_unset(self, job_id, return_code):
         return_code_str = self._read_job_file(job_id, JOB_FILE_RETURN_CODE, default=PULSAR_UNKNOWN_RETURN_CODE)
@@ -194,7 +194,4 @@ class DirectoryBaseManager(BaseManager):
         return job_template_env
 
     def _write_job_script(self, job_id, contents):
-        self._write_job_file(job_id, "command.sh", contents)
-        script_path = self._job_file(job_id, "command.sh")
-        os.chmod(script_path, stat.S_IEXEC | stat.S_IWRITE | stat.S_IREAD)
-        return script_path
+        return self._write_job_file(job_id, "command.sh", contents, mode=stat.S_IEXEC | stat.S_IWRITE | stat.S_IREAD)
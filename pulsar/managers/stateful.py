@@ -153,11 +153,31 @@ class StatefulManagerProxy(ManagerProxy):
         and track additional state information needed.
         """
         job_directory = self._proxied_manager.job_directory(job_id)
+        return self.__get_status(job_directory, job_id)
+
+    def get_statuses(self, job_ids):
+        """ Like get_status for each of job_ids, but query the proxied manager
+        for the status of all launched jobs with a single get_statuses call.
+        """
+        job_directories = {job_id: self._proxied_manager.job_directory(job_id) for job_id in job_ids}
+        launched_job_ids = [
+            job_id for job_id, job_directory in job_directories.items()
+            if job_directory.exists() and self.__requires_proxy_status(job_directory)
+        ]
+        proxied_statuses = {}
+        if launched_job_ids:
+            proxied_statuses = self._proxied_manager.get_statuses(launched_job_ids)
+        return {
+            job_id: self.__get_status(job_directory, job_id, proxied_statuses.get(job_id))
+            for job_id, job_directory in job_directories.items()
+        }
+
+    def __get_status(self, job_directory, job_id, proxied_status=None):
         if not job_directory.exists():
             return status.LOST
 
         with job_directory.lock("status"):
-            proxy_status, state_change = self.__proxy_status(job_directory, job_id)
+            proxy_status, state_change = self.__proxy_status(job_directory, job_id, proxied_status)
 
         if state_change == "to_complete":
             self.__deactivate(job_id, proxy_status)
@@ -166,10 +186,21 @@ class StatefulManagerProxy(ManagerProxy):
 
         return self.__status(job_directory, proxy_status)
 
-    def __proxy_status(self, job_directory, job_id):
+    def __requires_proxy_status(self, job_directory):
+        """ Whether __proxy_status would ask the proxied manager for this job's
+        status.
+        """
+        return (
+            job_directory.has_metadata(JOB_FILE_PREPROCESSED) and
+            not job_directory.has_metadata(JOB_FILE_PREPROCESSING_FAILED) and
+            not job_directory.has_metadata(JOB_FILE_FINAL_STATUS)
+        )
+
+    def __proxy_status(self, job_directory, job_id, proxied_status=None):
         """ Determine state with proxied job manager and if this job needs
         to be marked as deactivated (this occurs when job first returns a
-        complete status from proxy.
+        complete status from proxy. proxied_status, if given, is the status
+        already fetched from the proxied manager.
         """
         state_change = None
         if job_directory.has_metadata(JOB_FILE_PREPROCESSING_FAILED):
@@ -181,7 +212,9 @@ class StatefulManagerProxy(ManagerProxy):
         elif job_directory.has_metadata(JOB_FILE_FINAL_STATUS):
             proxy_status = job_directory.load_metadata(JOB_FILE_FINAL_STATUS)
         else:
-            proxy_status = self._proxied_manager.get_status(job_id)
+            proxy_status = proxied_status
+            if proxy_status is None:
+                proxy_status = self._proxied_manager.get_status(job_id)
             if proxy_status == status.RUNNING:
                 if not job_directory.has_metadata(JOB_METADATA_RUNNING):
                     job_directory.store_metadata(JOB_METADATA_RUNNING, True)
@@ -1,6 +1,7 @@
 import _thread as thread
 import os
 import platform
+import shlex
 import tempfile
 import time
 from logging import getLogger
@@ -16,6 +17,9 @@ log = getLogger(__name__)
 JOB_FILE_SUBMITTED = "submitted"
 JOB_FILE_PID = "pid"
 
+# Command lines containing any of these need /bin/sh to be interpreted.
+SHELL_SPECIAL_CHARACTERS = frozenset(";&|<>$`*?'\"\\\n(){}[]~#=!")
+
 try:
     from galaxy.util.commands import new_clean_env
 except ImportError:
@@ -250,18 +254,33 @@ class CoexecutionManager(BaseUnqueuedManager):
 
 
 def execute(command_line, working_directory, stdout, stderr):
-    preexec_fn = None
-    if platform.system() != 'Windows':
-        preexec_fn = os.setpgrp
-    proc = Popen(
-        args=command_line,
-        shell=True,
+    is_posix = platform.system() != 'Windows'
+    popen_kwds = dict(
         cwd=working_directory,
         stdout=stdout,
         stderr=stderr,
-        preexec_fn=preexec_fn,
         env=new_clean_env(),
     )
+    if is_posix:
+        # Run the job in its own process group (like os.setpgrp) without
+        # requiring a preexec_fn callback in the forked child.
+        popen_kwds["start_new_session"] = True
+    if is_posix and isinstance(command_line, str) and not SHELL_SPECIAL_CHARACTERS.intersection(command_line):
+        # No shell syntax (typically just the job script path), skip the
+        # intermediate /bin/sh process.
+        args = shlex.split(command_line)
+        if args:
+            try:
+                return Popen(args=args, shell=False, **popen_kwds)
+            except OSError:
+                # e.g. a shell builtin or a non-executable file, let the
+                # shell handle and report it as before.
+                pass
+    proc = Popen(
+        args=command_line,
+        shell=True,
+        **popen_kwds
+    )
     return proc
 
 
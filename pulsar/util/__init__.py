@@ -1,39 +1,142 @@
 """ Pulsar utilities.
 """
+import io
+import os
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from shutil import copyfileobj
 from tempfile import NamedTemporaryFile
 
-BUFFER_SIZE = 4096
+BUFFER_SIZE = 1 << 17
+SENDFILE_CHUNK_SIZE = 1 << 20
+MAX_COPY_WORKERS = 32
+# Only Linux sendfile accepts a regular file as the output descriptor.
+SENDFILE_TO_FILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
 
 
 def copy_to_path(object, path):
     """
     Copy file-like object to path.
     """
-    output = open(path, 'wb')
-    _copy_and_close(object, output)
+    source = _sendfile_source(object)
+    if source is not None:
+        output_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            end = _sendfile(*source, output_fd)
+        finally:
+            os.close(output_fd)
+        if end is not None:
+            object.seek(end)
+            return
+    with open(path, 'wb', buffering=BUFFER_SIZE) as output:
+        copyfileobj(object, output, BUFFER_SIZE)
 
 
-def _copy_and_close(object, output):
-    try:
-        while True:
-            buffer = object.read(BUFFER_SIZE)
-            if not buffer:
-                break
-            output.write(buffer)
-    finally:
-        output.close()
+def copy_many_to_paths(pairs):
+    """
+    Copy each file-like object to its path for a list of
+    (object, path) pairs, overlapping the copies in a thread
+    pool. Once all copies have finished, re-raises the error of
+    the first failed pair (in the order given), if any.
 
+    >>> from io import BytesIO
+    >>> from os.path import join
+    >>> from shutil import rmtree
+    >>> from tempfile import mkdtemp
+    >>> temp_dir = mkdtemp()
+    >>> paths = [join(temp_dir, name) for name in ["moo", "cow"]]
+    >>> copy_many_to_paths([(BytesIO(b"moo"), paths[0]), (BytesIO(b"cow"), paths[1])])
+    >>> [open(path, "rb").read() for path in paths]
+    [b'moo', b'cow']
+    >>> rmtree(temp_dir)
+    """
+    if not pairs:
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(pairs))) as executor:
+        futures = [executor.submit(copy_to_path, object, path) for object, path in pairs]
+    for future in futures:
+        future.result()
 
-def copy_to_temp(object):
+
+def copy_to_temp(object, dir=None):
     """
-    Copy file-like object to temp file and return
-    path.
+    Copy file-like object to temp file (in dir if specified,
+    otherwise the default temp directory) and return path.
     """
-    temp_file = NamedTemporaryFile(delete=False)
-    _copy_and_close(object, temp_file)
+    temp_file = NamedTemporaryFile(delete=False, dir=dir)
+    source = _sendfile_source(object)
+    try:
+        end = None
+        if source is not None:
+            end = _sendfile(*source, temp_file.file.fileno())
+        if end is None:
+            copyfileobj(object, temp_file, BUFFER_SIZE)
+        else:
+            object.seek(end)
+    except BaseException:
+        temp_file.close()
+        os.remove(temp_file.name)
+        raise
+    temp_file.close()
     return temp_file.name
 
 
+def copy_to_scratch(object, near):
+    """
+    Copy file-like object to a temp file in directory near and
+    return path. Use this when the file is about to be moved into
+    near, so the move is a rename on the same filesystem rather
+    than a copy across devices.
+    """
+    return copy_to_temp(object, dir=near)
+
+
+def _sendfile_source(object):
+    """
+    Return (file descriptor, offset) for object if it is a plain file
+    object (io.FileIO or an io.BufferedReader over one) reading a regular
+    file and this platform can sendfile to a file, otherwise None.
+    Wrappers that expose another object's fileno() (e.g. webob's length
+    limited request body) are not plain files and must be copied through
+    read().
+    """
+    if not SENDFILE_TO_FILE:
+        return None
+    raw = object.raw if isinstance(object, io.BufferedReader) else object
+    if not isinstance(raw, io.FileIO):
+        return None
+    try:
+        fd = object.fileno()
+        st = os.fstat(fd)
+        offset = object.tell()
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return fd, offset
+
+
+def _sendfile(source_fd, offset, output_fd):
+    """
+    Copy source_fd from offset to the end of the file into output_fd in
+    kernel space and return the offset copied up to. Return None if
+    sendfile is unsupported for these descriptors (nothing has been
+    written yet).
+    """
+    start = offset
+    while True:
+        try:
+            sent = os.sendfile(output_fd, source_fd, offset, SENDFILE_CHUNK_SIZE)
+        except OSError:
+            if offset == start:
+                return None
+            raise
+        if sent == 0:
+            return offset
+        offset += sent
+
+
 def enum(**enums):
     """
     http://stackoverflow.com/questions/36932/how-can-i-represent-an-enum-in-python
@@ -14,7 +14,7 @@ from pulsar.manager_endpoint_util import (
 from pulsar.manager_factory import DEFAULT_MANAGER_NAME
 from pulsar.util import (
     copy_to_path,
-    copy_to_temp,
+    copy_to_scratch,
 )
 from pulsar.web.framework import Controller
 
@@ -152,7 +152,7 @@ def cache_required(file_cache, ip, path):
 
 @PulsarController(path="/cache", method="POST", response_type='json')
 def cache_insert(file_cache, ip, path, body):
-    temp_path = copy_to_temp(body)
+    temp_path = copy_to_scratch(body, near=file_cache.scratch_directory())
     file_cache.cache_file(temp_path, ip, path)
 
 
@@ -1,9 +1,13 @@
-from os import remove
-from os.path import exists
+import errno
+from os import remove, utime
+from os.path import exists, join
+from time import time
+from unittest import mock
 from tempfile import mkdtemp, NamedTemporaryFile
 from .test_utils import TestCase
 
 from pulsar.cache import Cache
+from pulsar.cache.util import atomicish_move
 from shutil import rmtree
 
 
@@ -34,3 +38,55 @@ class CacheTest(TestCase):
         assert not cache.file_available("127.0.0.2", "/galaxy/dataset10001.dat")["ready"]
         cache.cache_file(self.temp_file.name, "127.0.0.2", "/galaxy/dataset10001.dat")
         assert cache.file_available("127.0.0.2", "/galaxy/dataset10001.dat")["ready"]
+
+    def test_stale_scratch_files_purged(self):
+        stale_path = join(self.cache.scratch_directory(), "stale")
+        fresh_path = join(self.cache.scratch_directory(), "fresh")
+        for path in [stale_path, fresh_path]:
+            open(path, "wb").close()
+        two_days_ago = time() - 2 * 24 * 60 * 60
+        utime(stale_path, (two_days_ago, two_days_ago))
+        self.cache.close()
+        self.cache = Cache(self.temp_dir)
+        assert not exists(stale_path)
+        assert exists(fresh_path)
+
+
+class AtomicishMoveTest(TestCase):
+
+    def setUp(self):
+        self.temp_dir = mkdtemp()
+        self.source = join(self.temp_dir, "the_source")
+        self.destination = join(self.temp_dir, "the_dest")
+        with open(self.source, "wb") as f:
+            f.write(b"Hello World!")
+
+    def tearDown(self):
+        rmtree(self.temp_dir)
+
+    def test_move(self):
+        atomicish_move(self.source, self.destination)
+        assert not exists(self.source)
+        self._assert_moved()
+
+    def test_cross_device_move(self):
+        cross_device = OSError(errno.EXDEV, "Invalid cross-device link")
+        with mock.patch("os.replace", side_effect=cross_device) as replace:
+            atomicish_move(self.source, self.destination)
+        assert replace.called
+        assert not exists(self.source)
+        assert not exists(self.destination + "_TMP")
+        self._assert_moved()
+
+    def test_other_errors_propagate(self):
+        denied = OSError(errno.EACCES, "Permission denied")
+        with mock.patch("os.replace", side_effect=denied):
+            with self.assertRaises(OSError) as context:
+                atomicish_move(self.source, self.destination)
+        assert context.exception.errno == errno.EACCES
+        assert exists(self.source)
+        assert not exists(self.destination)
+
+    def _assert_moved(self):
+        with open(self.destination, "rb") as f:
+            assert f.read() == b"Hello World!"
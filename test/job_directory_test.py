@@ -1,6 +1,7 @@
 from .test_utils import TempDirectoryTestCase
 from pulsar.managers.base import JobDirectory
 import os
+from unittest import mock
 
 TEST_JOB_ID = "1234"
 
@@ -17,11 +18,68 @@ class JobDirectoryTestCase(TempDirectoryTestCase):
         self.job_directory.setup()
         assert os.path.exists(expected_path)
 
+    def test_setup_all(self):
+        self.job_directory.setup_all()
+        for name in ["inputs", "working", "outputs", "configs", "tool_files", "metadata"]:
+            assert os.path.isdir(os.path.join(self.temp_directory, TEST_JOB_ID, name))
+
     def test_metadata(self):
         self.prep()
         assert not self.job_directory.has_metadata("MooCow")
         self.job_directory.store_metadata("MooCow", True)
         assert self.job_directory.has_metadata("MooCow")
 
+    def test_read_file(self):
+        self.prep()
+        self.job_directory.write_file("moo", "cow")
+        assert self.job_directory.read_file("moo") == b"cow"
+        assert self.job_directory.read_file("moo", size=2) == b"co"
+        assert self.job_directory.read_file("missing", default=b"none") == b"none"
+        large_contents = b"x" * (1 << 18)
+        self.job_directory.write_file("large", large_contents)
+        assert self.job_directory.read_file("large") == large_contents
+
+    def test_write_file_parts(self):
+        self.prep()
+        self.job_directory.write_file_parts("moo", ["co", b"w", "", "s"])
+        assert self.job_directory.read_file("moo") == b"cows"
+        parts = [b"%d\n" % i for i in range(3000)]
+        self.job_directory.write_file_parts("many", parts)
+        assert self.job_directory.read_file("many") == b"".join(parts)
+
+    def test_write_file_mode(self):
+        self.prep()
+        path = self.job_directory.write_file("script.sh", "#!/bin/sh", mode=0o700)
+        assert os.stat(path).st_mode & 0o777 == 0o700
+        self.job_directory.write_file("script.sh", "#!/bin/bash", mode=0o600)
+        assert os.stat(path).st_mode & 0o777 == 0o600
+        assert self.job_directory.read_file("script.sh") == b"#!/bin/bash"
+
+    def test_calculate_path(self):
+        self.job_directory.setup_all()
+        expected_path = os.path.join(self.temp_directory, TEST_JOB_ID, "inputs", "dataset_1_files", "moo")
+        assert self.job_directory.calculate_path("dataset_1_files/moo", "input") == expected_path
+        assert self.job_directory.calculate_path("dataset_1_files/cow", "input") == os.path.join(os.path.dirname(expected_path), "cow")
+        with self.assertRaises(Exception):
+            self.job_directory.calculate_path("../../moo", "input")
+        for empty_path in ["", "/", "//"]:
+            with self.assertRaises(Exception):
+                self.job_directory.calculate_path(empty_path, "input")
+
+    def test_delete(self):
+        self.prep()
+        self.job_directory.write_file("moo", "cow")
+        self.job_directory.delete()
+        assert not os.path.exists(self.job_directory.path)
+
+    def test_delete_logs_errors(self):
+        self.prep()
+        self.job_directory.write_file("moo", "cow")
+        with mock.patch("os.unlink", side_effect=PermissionError("denied")):
+            with self.assertLogs("pulsar.managers.base", level="WARNING") as logs:
+                self.job_directory.delete()
+        assert "denied" in logs.output[0]
+        assert os.path.exists(self.job_directory.path)
+
     def prep(self):
         self.job_directory.setup()
@@ -2,8 +2,10 @@ from contextlib import contextmanager
 from os.path import exists, join
 import time
 
+from pulsar.managers import status
 from pulsar.managers.queued import QueueManager
 from pulsar.managers.stateful import StatefulManagerProxy
+from pulsar.managers.unqueued import Manager
 from pulsar.tools.authorization import get_authorizer
 from .test_utils import (
     temp_directory,
@@ -80,6 +82,36 @@ def test_preprocessing_job_recovery_dirty():
         assert exists(touch_file)
 
 
+def test_get_statuses_uses_proxied_batch():
+    with _app() as app:
+        manager = BatchStatusManager('test', app)
+        proxy = StatefulManagerProxy(manager)
+        launched_job_id = proxy.setup_job("1", 'tool1', '1.0.0')
+        proxy.preprocess_and_launch(launched_job_id, {"command_line": "true"})
+        unlaunched_job_id = proxy.setup_job("2", 'tool1', '1.0.0')
+
+        statuses = proxy.get_statuses([launched_job_id, unlaunched_job_id, "3"])
+
+        # Only the launched job needs the backend, and it is queried in one call.
+        assert manager.batch_calls == [[launched_job_id]]
+        assert statuses[launched_job_id] in [status.QUEUED, status.RUNNING, status.POSTPROCESSING]
+        assert statuses[unlaunched_job_id] == status.PREPROCESSING
+        assert statuses["3"] == status.LOST
+
+        # Same state handling as get_status once the job completes.
+        _wait_for_status(proxy, launched_job_id, status.POSTPROCESSING)
+        assert proxy.get_status(launched_job_id) == status.POSTPROCESSING
+        proxy.shutdown()
+
+
+def _wait_for_status(proxy, job_id, expected_status):
+    for _ in range(100):
+        if proxy.get_statuses([job_id]) == {job_id: expected_status}:
+            return
+        time.sleep(.05)
+    raise AssertionError("Job did not reach status %s." % expected_status)
+
+
 def _setup_manager_that_preprocesses(app):
     # Setup a manager that will preprocess the job but won't execute it.
 
@@ -137,3 +169,14 @@ class DoesntPreprocessStatefulManagerProxy(StatefulManagerProxy):
 
     def _launch_prepreprocessing_thread(self, job_id, launch_config):
         pass
+
+
+class BatchStatusManager(Manager):
+
+    def __init__(self, name, app, **kwds):
+        super().__init__(name, app, **kwds)
+        self.batch_calls = []
+
+    def get_statuses(self, job_ids):
+        self.batch_calls.append(list(job_ids))
+        return super().get_statuses(job_ids)
@@ -1,7 +1,16 @@
+import io
+from os import listdir
 from os.path import join
 
-from pulsar.web.routes import _output_path
-from .test_utils import test_manager
+from pulsar.cache import Cache
+from pulsar.web.routes import (
+    _output_path,
+    cache_insert,
+)
+from .test_utils import (
+    temp_directory,
+    test_manager,
+)
 
 
 def test_output_path():
@@ -22,3 +31,17 @@ def test_output_path_security():
         except Exception:
             raised_exception = True
         assert raised_exception
+
+
+def test_cache_insert():
+    with temp_directory() as cache_directory:
+        cache = Cache(cache_directory)
+        try:
+            cache_insert.func(cache, "127.0.0.2", "/galaxy/dataset10001.dat", io.BytesIO(b"moo"))
+            available = cache.file_available("127.0.0.2", "/galaxy/dataset10001.dat")
+            assert available["ready"]
+            with open(cache.destination(available["token"]), "rb") as f:
+                assert f.read() == b"moo"
+            assert listdir(cache.scratch_directory()) == []
+        finally:
+            cache.close()
@@ -194,6 +194,8 @@ python -c "import sys; sys.stdout.write(\'Hello World!\'); sys.stdout.flush(); s
         self.assertEqual(manager.stderr_contents(job_id), b"moo")
         self.assertEqual(manager.stdout_contents(job_id), b"Hello World!")
         self.assertEqual(manager.return_code(job_id), 0)
+        self.assertEqual(manager.return_codes([job_id]), {job_id: 0})
+        self.assertEqual(manager.get_statuses([job_id]), {job_id: manager.get_status(job_id)})
         manager.clean(job_id)
         self.assertEqual(len(listdir(self.staging_directory)), 0)
 
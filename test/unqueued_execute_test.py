@@ -0,0 +1,58 @@
+import os
+import platform
+import subprocess
+from unittest import mock
+
+import pytest
+
+from .test_utils import TempDirectoryTestCase
+from pulsar.managers import unqueued
+from pulsar.managers.unqueued import execute
+
+pytestmark = pytest.mark.skipif(platform.system() == "Windows", reason="POSIX process handling")
+
+
+class ExecuteTestCase(TempDirectoryTestCase):
+
+    def test_script_path_runs_without_shell(self):
+        script_path = os.path.join(self.temp_directory, "script.sh")
+        with open(script_path, "w") as f:
+            f.write("#!/bin/sh\necho moo\n")
+        os.chmod(script_path, 0o700)
+        proc, popen = self._execute(script_path)
+        assert proc.communicate()[0] == b"moo\n"
+        assert self._shell_args(popen) == [False]
+
+    def test_metacharacters_use_shell(self):
+        proc, popen = self._execute("echo moo > out")
+        proc.communicate()
+        assert self._shell_args(popen) == [True]
+        with open(os.path.join(self.temp_directory, "out"), "rb") as f:
+            assert f.read() == b"moo\n"
+
+    def test_exec_failure_falls_back_to_shell(self):
+        # No #! line - the direct exec fails with ENOEXEC but sh runs it.
+        script_path = os.path.join(self.temp_directory, "script.sh")
+        with open(script_path, "w") as f:
+            f.write("echo moo\n")
+        os.chmod(script_path, 0o700)
+        proc, popen = self._execute(script_path)
+        assert proc.communicate()[0] == b"moo\n"
+        assert proc.returncode == 0
+        assert self._shell_args(popen) == [False, True]
+
+    def test_process_group_leader(self):
+        proc, _ = self._execute("sleep 10")
+        try:
+            assert os.getpgid(proc.pid) == proc.pid
+        finally:
+            proc.kill()
+            proc.communicate()
+
+    def _execute(self, command_line):
+        with mock.patch.object(unqueued, "Popen", wraps=subprocess.Popen) as popen:
+            proc = execute(command_line, self.temp_directory, subprocess.PIPE, subprocess.PIPE)
+        return proc, popen
+
+    def _shell_args(self, popen):
+        return [call[1]["shell"] for call in popen.call_args_list]
@@ -0,0 +1,131 @@
+import io
+import os
+from tempfile import TemporaryFile
+from unittest import mock
+
+from webob.request import LimitedLengthFile
+
+from .test_utils import TempDirectoryTestCase
+from pulsar import util
+from pulsar.util import (
+    copy_many_to_paths,
+    copy_to_path,
+    copy_to_scratch,
+    copy_to_temp,
+)
+
+TEST_CONTENTS = b"abcdefghij"
+
+
+class CopyTestCase(TempDirectoryTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.source_path = self._path("source")
+        with open(self.source_path, "wb") as f:
+            f.write(TEST_CONTENTS)
+
+    def test_copy_to_path_file(self):
+        with open(self.source_path, "rb") as source:
+            copy_to_path(source, self._path("dest"))
+            assert source.read() == b""
+        self._assert_contents(self._path("dest"), TEST_CONTENTS)
+
+    def test_copy_to_path_partially_read_file(self):
+        with open(self.source_path, "rb") as source:
+            assert source.read(3) == b"abc"
+            copy_to_path(source, self._path("dest"))
+            assert source.read() == b""
+        self._assert_contents(self._path("dest"), TEST_CONTENTS[3:])
+
+    def test_copy_to_path_file_without_sendfile(self):
+        with mock.patch.object(util, "SENDFILE_TO_FILE", False), mock.patch("os.open") as os_open:
+            with open(self.source_path, "rb") as source:
+                copy_to_path(source, self._path("dest"))
+        # Destination is only opened once, by the buffered copy.
+        assert not os_open.called
+        self._assert_contents(self._path("dest"), TEST_CONTENTS)
+
+    def test_copy_to_path_bytes_io(self):
+        copy_to_path(io.BytesIO(TEST_CONTENTS), self._path("dest"))
+        self._assert_contents(self._path("dest"), TEST_CONTENTS)
+
+    def test_copy_to_path_limited_length_body(self):
+        # webob request body - fileno() is that of the whole underlying input.
+        with TemporaryFile() as wsgi_input:
+            wsgi_input.write(TEST_CONTENTS)
+            wsgi_input.seek(0)
+            body = io.BufferedReader(LimitedLengthFile(wsgi_input, 4))
+            copy_to_path(body, self._path("dest"))
+        self._assert_contents(self._path("dest"), TEST_CONTENTS[:4])
+
+    def test_copy_to_temp_file(self):
+        with open(self.source_path, "rb") as source:
+            source.read(3)
+            temp_path = copy_to_temp(source)
+        try:
+            self._assert_contents(temp_path, TEST_CONTENTS[3:])
+        finally:
+            os.remove(temp_path)
+
+    def test_copy_to_temp_limited_length_body(self):
+        with TemporaryFile() as wsgi_input:
+            wsgi_input.write(TEST_CONTENTS)
+            wsgi_input.seek(0)
+            body = io.BufferedReader(LimitedLengthFile(wsgi_input, 4))
+            temp_path = copy_to_temp(body)
+        try:
+            self._assert_contents(temp_path, TEST_CONTENTS[:4])
+        finally:
+            os.remove(temp_path)
+
+    def test_copy_to_scratch(self):
+        scratch_directory = self._path("scratch")
+        os.mkdir(scratch_directory)
+        temp_path = copy_to_scratch(io.BytesIO(TEST_CONTENTS), near=scratch_directory)
+        assert os.path.dirname(temp_path) == scratch_directory
+        self._assert_contents(temp_path, TEST_CONTENTS)
+
+    def test_copy_to_temp_failure_removes_temp_file(self):
+        scratch_directory = self._path("scratch")
+        os.mkdir(scratch_directory)
+        with self.assertRaises(OSError):
+            copy_to_temp(FailingReader(), dir=scratch_directory)
+        assert os.listdir(scratch_directory) == []
+
+    def test_copy_many_to_paths(self):
+        with open(self.source_path, "rb") as source:
+            copy_many_to_paths([
+                (source, self._path("dest1")),
+                (io.BytesIO(b"moo"), self._path("dest2")),
+            ])
+        self._assert_contents(self._path("dest1"), TEST_CONTENTS)
+        self._assert_contents(self._path("dest2"), b"moo")
+
+    def test_copy_many_to_paths_failure(self):
+        pairs = [
+            (io.BytesIO(b"moo"), self._path("dest1")),
+            (io.BytesIO(b"cow"), self._path("missing_dir/dest2")),
+            (io.BytesIO(b"pig"), self._path("dest3")),
+        ]
+        with self.assertRaises(FileNotFoundError):
+            copy_many_to_paths(pairs)
+        # The other copies still complete.
+        self._assert_contents(self._path("dest1"), b"moo")
+        self._assert_contents(self._path("dest3"), b"pig")
+
+    def _path(self, name):
+        return os.path.join(self.temp_directory, name)
+
+    def _assert_contents(self, path, expected):
+        with open(path, "rb") as f:
+            assert f.read() == expected
+
+
+class FailingReader(io.RawIOBase):
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        raise OSError("The client disconnected while sending the body")